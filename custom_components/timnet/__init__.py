@@ -3,16 +3,33 @@ import logging
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
+from .const import CONF_HOST, CONF_PORT, CONF_SCAN_INTERVAL, CONF_UNIT, DOMAIN
+from .coordinator import TimNetCoordinator
+
 _LOGGER = logging.getLogger(__name__)
 
-DOMAIN = "timnet"
 PLATFORMS = ["sensor"]  # Binary sensors are created within sensor platform
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up TimNet from a config entry."""
+    config = entry.data
+    coordinator = TimNetCoordinator(
+        hass,
+        entry,
+        host=config[CONF_HOST],
+        port=config[CONF_PORT],
+        unit=config.get(CONF_UNIT, 1),
+        scan_interval=config.get(CONF_SCAN_INTERVAL, 8),
+    )
+    entry.async_on_unload(coordinator.async_shutdown)
+
+    # Raises ConfigEntryNotReady (setup is retried) until the device answers,
+    # so model detection in the sensor platform always sees real data
+    await coordinator.async_config_entry_first_refresh()
+
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = entry.data
+    hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
@@ -4,14 +4,10 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import callback
 
-_LOGGER = logging.getLogger(__name__)
-
-DOMAIN = "timnet"
+from .const import CONF_HOST, CONF_PORT, CONF_SCAN_INTERVAL, CONF_UNIT, DOMAIN
+from .modbus_client import AsyncMinimalModbusTcpClient
 
-CONF_HOST = "host"
-CONF_PORT = "port"
-CONF_UNIT = "unit"
-CONF_SCAN_INTERVAL = "scan_interval"
+_LOGGER = logging.getLogger(__name__)
 
 
 class TimNetConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -29,9 +25,7 @@ class TimNetConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             
             try:
                 # Test connection
-                await self.hass.async_add_executor_job(
-                    self._test_connection, host, port, user_input.get(CONF_UNIT, 1)
-                )
+                await self._test_connection(host, port, user_input.get(CONF_UNIT, 1))
                 
                 # Create unique ID based on host
                 await self.async_set_unique_id(f"{host}_{port}")
@@ -60,23 +54,17 @@ class TimNetConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
-    def _test_connection(self, host: str, port: int, unit: int):
+    async def _test_connection(self, host: str, port: int, unit: int):
         """Test connection to the TimNet device."""
-        import socket
-        import struct
-        
+        client = AsyncMinimalModbusTcpClient(host, port, unit=unit)
         try:
-            with socket.create_connection((host, port), timeout=3) as s:
-                s.settimeout(3)
-                # Try to read 1 holding register at address 0
-                pdu = struct.pack(">BHH", 3, 0, 1)
-                mbap = struct.pack(">HHHB", 1, 0, len(pdu) + 1, unit)
-                s.sendall(mbap + pdu)
-                # Read response
-                resp = s.recv(4096)
-                if len(resp) < 9:
-                    raise ConnectionError("Invalid response")
-                return True
+            # Try to read 1 holding register at address 0
+            regs = await client.read_holding_registers(0x0000, 1)
+            if len(regs) != 1:
+                raise ConnectionError("Invalid response")
+            return True
         except Exception as err:
             _LOGGER.error("Connection test failed: %s", err)
             raise
+        finally:
+            await client.close()
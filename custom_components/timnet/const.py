@@ -0,0 +1,12 @@
+"""Constants for TimNet Heating Controller integration."""
+
+DOMAIN = "timnet"
+
+CONF_HOST = "host"
+CONF_PORT = "port"
+CONF_UNIT = "unit"
+CONF_SCAN_INTERVAL = "scan_interval"
+
+# Registers 0x0000-0x0015 cover all definitions and are read in one request;
+# coordinator data is a list indexed by register address
+REGISTER_COUNT = 0x0016
@@ -0,0 +1,78 @@
+"""Data update coordinator for TimNet Heating Controller integration."""
+import logging
+from datetime import timedelta
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import (
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
+
+from .const import DOMAIN, REGISTER_COUNT
+from .modbus_client import AsyncMinimalModbusTcpClient
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TimNetCoordinator(DataUpdateCoordinator):
+    """Class to manage fetching TimNet data."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        host: str,
+        port: int,
+        unit: int,
+        scan_interval: int,
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            config_entry=entry,
+            name=DOMAIN,
+            update_interval=timedelta(seconds=scan_interval),
+        )
+        self.host = host
+        self.port = port
+        self.unit = unit
+        self._last_valid_data: list[int] = []
+        self.connection_ok: bool = True
+        self._client = AsyncMinimalModbusTcpClient(host, port, unit=unit)
+
+    async def _async_update_data(self) -> list[int]:
+        try:
+            data = await self._fetch_data()
+        except Exception as err:
+            self.connection_ok = False
+            if not self._last_valid_data:
+                # Nothing to fall back to yet (e.g. device offline during setup)
+                raise UpdateFailed(
+                    f"Error reading from {self.host}:{self.port}: {err}"
+                ) from err
+            _LOGGER.warning(
+                "Error reading from %s:%s: %s - using last known values",
+                self.host,
+                self.port,
+                err,
+            )
+            return self._last_valid_data
+
+        self.connection_ok = True
+        # Return the previous object when registers are unchanged
+        if data != self._last_valid_data:
+            self._last_valid_data = data
+        return self._last_valid_data
+
+    async def async_shutdown(self) -> None:
+        """Close the persistent Modbus connection."""
+        await super().async_shutdown()
+        await self._client.close()
+
+    async def _fetch_data(self) -> list[int]:
+        """Fetch data from TimNet device (runs on the event loop)."""
+        # Read registers 0-21 (covers all defined registers)
+        # The client rejects responses with fewer registers than requested
+        return await self._client.read_holding_registers(0x0000, REGISTER_COUNT)
@@ -1,11 +1,51 @@
 """Modbus TCP minimal client for Home Assistant integration."""
+import asyncio
 import socket
 import struct
-from typing import List
+from typing import List, Optional
 
+# MBAP header (7) + function code + byte count (or exception code)
+RESPONSE_HEAD_SIZE = 9
 
-class MinimalModbusTcpClient:
-    """Minimal Modbus TCP client (handles non-standard MBAP headers)."""
+
+def _build_read_adu(tid: int, unit: int, address: int, count: int) -> bytes:
+    """Build a complete Read Holding Registers (0x03) request ADU."""
+    if count < 1 or count > 125:
+        raise ValueError("count must be 1..125")
+    # MBAP header (length = unit id + 5-byte PDU) and PDU packed in one go
+    return struct.pack(">HHHBBHH", tid, 0, 6, unit, 3, address & 0xFFFF, count & 0xFFFF)
+
+
+class _StaleConnectionError(IOError):
+    """Connection was closed before any response bytes arrived."""
+
+
+class _FramingError(IOError):
+    """Response does not belong to the request (stream out of sync)."""
+
+
+def _response_body_size(head: bytes) -> int:
+    """Return the bytes following the response head.
+
+    Framing uses the PDU byte count, not the MBAP length field, because the
+    device's MBAP header cannot be relied on.
+    """
+    if head[7] & 0x80:
+        # Exception response ends with the exception code (already in head)
+        return 0
+    return head[8]
+
+
+def _decode_read_response(frame: bytes, count: int) -> List[int]:
+    """Decode a Read Holding Registers response frame (head already checked)."""
+    if frame[7] & 0x80:
+        raise IOError(f"Exception response: {frame[7:].hex()}")
+    # Decode big-endian (standard Modbus) registers in place, without slicing
+    return list(struct.unpack_from(f">{count}H", frame, RESPONSE_HEAD_SIZE))
+
+
+class AsyncMinimalModbusTcpClient:
+    """Minimal asyncio Modbus TCP client (handles non-standard MBAP headers)."""
 
     def __init__(self, host: str, port: int = 502, timeout: float = 3.0, unit: int = 1):
         self.host = host
@@ -13,42 +53,103 @@ class MinimalModbusTcpClient:
         self.timeout = timeout
         self.unit = unit
         self._tid = 0
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._addr_info: Optional[tuple] = None
+        # Learned from the first response: whether the device echoes the TID
+        self._echoes_tid: Optional[bool] = None
 
     def _next_tid(self) -> int:
         self._tid = (self._tid + 1) & 0xFFFF
         return self._tid
 
-    def _send_request(self, pdu: bytes) -> bytes:
-        tid = self._next_tid()
-        protocol = 0
-        length = len(pdu) + 1
-        header = struct.pack(">HHHB", tid, protocol, length, self.unit)
-        adu = header + pdu
-        with socket.create_connection((self.host, self.port), timeout=self.timeout) as s:
-            s.settimeout(self.timeout)
-            s.sendall(adu)
-            data = s.recv(4096)
-            if len(data) < 7:
-                raise IOError("Incomplete response")
-            pdu_resp = data[7:]
-            return pdu_resp
-
-    def read_holding_registers(self, address: int, count: int = 1) -> List[int]:
+    async def _ensure_connection(self) -> None:
+        """Open the connection if needed (asyncio enables TCP_NODELAY itself)."""
+        if self._writer is None:
+            loop = asyncio.get_running_loop()
+            # Resolve once; re-resolve only after a failed connect
+            if self._addr_info is None:
+                infos = await loop.getaddrinfo(self.host, self.port, type=socket.SOCK_STREAM)
+                self._addr_info = infos[0]
+            family, socktype, proto, _, sockaddr = self._addr_info
+            sock = socket.socket(family, socktype, proto)
+            try:
+                sock.setblocking(False)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+                await loop.sock_connect(sock, sockaddr)
+            except BaseException:
+                sock.close()
+                self._addr_info = None
+                raise
+            self._reader, self._writer = await asyncio.open_connection(sock=sock)
+
+    def _drop_connection(self) -> None:
+        """Forget the connection without waiting for it to close."""
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = None
+        self._writer = None
+
+    async def close(self) -> None:
+        """Close the connection (next request reconnects)."""
+        writer = self._writer
+        self._drop_connection()
+        if writer is not None:
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    def _check_response_head(self, head: bytes, tid: int, count: int) -> None:
+        """Make sure the response head answers this request."""
+        fc = head[7]
+        if fc & 0x7F != 3:
+            raise _FramingError(f"Unexpected function code: 0x{fc:02X}")
+        resp_tid = struct.unpack_from(">H", head)[0]
+        if self._echoes_tid is None:
+            self._echoes_tid = resp_tid == tid
+        elif self._echoes_tid and resp_tid != tid:
+            raise _FramingError(f"Transaction id mismatch: {resp_tid} != {tid}")
+        if not fc & 0x80 and head[8] != 2 * count:
+            raise _FramingError(f"Unexpected byte count: {head[8]} (expected {2 * count})")
+
+    async def _exchange(self, adu: bytes, tid: int, count: int) -> bytes:
+        await self._ensure_connection()
+        try:
+            self._writer.write(adu)
+            await self._writer.drain()
+            head = await self._reader.readexactly(RESPONSE_HEAD_SIZE)
+        except asyncio.IncompleteReadError as err:
+            if not err.partial:
+                raise _StaleConnectionError("Connection closed by device") from err
+            raise IOError("Incomplete response") from err
+        except ConnectionError as err:
+            raise _StaleConnectionError(str(err)) from err
+        self._check_response_head(head, tid, count)
+        try:
+            return head + await self._reader.readexactly(_response_body_size(head))
+        except asyncio.IncompleteReadError as err:
+            raise IOError("Incomplete response") from err
+
+    async def _send_request(self, adu: bytes, tid: int, count: int) -> bytes:
+        while True:
+            reused = self._writer is not None
+            try:
+                return await asyncio.wait_for(self._exchange(adu, tid, count), timeout=self.timeout)
+            except _StaleConnectionError:
+                self._drop_connection()
+                if not reused:
+                    raise
+                # Device drops idle connections; resend once on a fresh one
+            except BaseException:
+                # Stream position is unknown after any failure (incl. timeout
+                # and framing errors)
+                self._drop_connection()
+                raise
+
+    async def read_holding_registers(self, address: int, count: int = 1) -> List[int]:
         """Read holding registers."""
-        if count < 1 or count > 125:
-            raise ValueError("count must be 1..125")
-        pdu = struct.pack(">BHH", 3, address & 0xFFFF, count & 0xFFFF)
-        resp = self._send_request(pdu)
-        if not resp:
-            raise IOError("No response")
-        fc = resp[0]
-        if fc & 0x80:
-            raise IOError(f"Exception response: {resp.hex()}")
-        byte_count = resp[1]
-        regs_bytes = resp[2:2+byte_count]
-        regs = []
-        for i in range(0, len(regs_bytes), 2):
-            if i+1 < len(regs_bytes):
-                # Read as big-endian (standard Modbus)
-                regs.append(struct.unpack('>H', regs_bytes[i:i+2])[0])
-        return regs[:count]
+        tid = self._next_tid()
+        adu = _build_read_adu(tid, self.unit, address, count)
+        frame = await self._send_request(adu, tid, count)
+        return _decode_read_response(frame, count)
@@ -1,32 +1,23 @@
 """Sensor platform for TimNet Heating Controller integration."""
 import logging
-from datetime import timedelta
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass, SensorStateClass
 from homeassistant.components.binary_sensor import BinarySensorEntity, BinarySensorDeviceClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import EntityCategory
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-    UpdateFailed,
-)
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.const import UnitOfTemperature, UnitOfTime
 from homeassistant.helpers.entity import DeviceInfo
 
-from .modbus_client import MinimalModbusTcpClient
+from .const import DOMAIN
+from .coordinator import TimNetCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-DOMAIN = "timnet"
-CONF_HOST = "host"
-CONF_PORT = "port"
-CONF_UNIT = "unit"
-CONF_SCAN_INTERVAL = "scan_interval"
-
 # TimNet register definitions according to manual
 REGISTER_DEFINITIONS = [
     {
@@ -145,6 +136,147 @@ REGISTER_DEFINITIONS = [
     },
 ]
 
+# Door switch register (exposed as binary sensor)
+DOOR_ADDRESS = 0x0004
+
+# Sensors present on all models vs. TimNet 200 only
+_COMMON_DEFS = [d for d in REGISTER_DEFINITIONS if not d.get("timnet_200_only")]
+_OPT_DEFS = [d for d in REGISTER_DEFINITIONS if d.get("timnet_200_only")]
+
+# T2 register values meaning the sensor is inactive (indicates TimNet 100)
+T2_INACTIVE_VALUES = {20000, 20001, 20002}
+
+
+# Status text mappings
+STATUS_MAP = MappingProxyType({
+    0: "Start napájení",
+    1: "Klidový stav 100%",
+    2: "Klidový stav 0%",
+    3: "Zatápění",
+    4: "Start regulace",
+    5: "Hoření (vzrůstající teplota)",
+    6: "Hoření (klesající teplota)",
+    7: "Přiložit",
+    8: "Žárový proces",
+    10: "Nezatopeno",
+    13: "Přetopeno",
+    14: "Dlouho otevřená dvířka",
+    15: "Testovací režim",
+    20: "Porucha teploty",
+})
+
+MODE_MAP = MappingProxyType({1: "Eco", 2: "Standard", 3: "Turbo"})
+FUEL_MAP = MappingProxyType({1: "Dřevo", 2: "Brikety"})
+REFUEL_MAP = MappingProxyType({1: "-2", 2: "-1", 3: "Standard", 4: "+1", 5: "+2"})
+SDS_LEVEL_MAP = MappingProxyType({1: "-2", 2: "-1", 3: "Standard", 4: "+1", 5: "+2"})
+COLOR_MAP = MappingProxyType({0: "Bez barvy", 1: "Žlutá", 2: "Zelená", 3: "Červená"})
+BEEP_MAP = MappingProxyType({0: "Vypnuto", 15: "Zapnuto"})
+RELAY_MAP = MappingProxyType({0: "Rozepnuto", 1: "Sepnuto"})
+
+
+def _decode_default(raw_value: int, divider: int | None) -> float | int:
+    """Return raw value (possibly with divider)."""
+    if divider:
+        return round(raw_value / divider, 1)
+    return raw_value
+
+
+# Special temperature register values
+TEMP_SENTINELS = MappingProxyType({
+    20000: "HI",
+    -20000: "LO",
+    65536 - 20000: "LO",  # Handle negative as unsigned
+    20001: "---",
+    20002: "Neaktivní",
+})
+
+
+def _decode_temp(raw_value: int, divider: int | None) -> float | int | str:
+    """Decode temperature values (T1, T2)."""
+    sentinel = TEMP_SENTINELS.get(raw_value)
+    if sentinel is not None:
+        return sentinel
+    # Temperature is stored as value*10, divide to get °C
+    return _decode_default(raw_value, divider)
+
+
+def _decode_ser1(raw_value: int, divider: int | None) -> int | str:
+    """Decode flap position (0-100%, 255 = initializing)."""
+    if raw_value == 255:
+        return "Inicializace"
+    # Direct percentage value
+    return min(100, max(0, raw_value))
+
+
+def _decode_sds(raw_value: int, divider: int | None) -> str:
+    """Decode SDS sensitivity."""
+    if raw_value == 255:
+        return "Vypnuto"
+    active = raw_value % 10
+    level = raw_value // 10
+    level_str = SDS_LEVEL_MAP.get(level, "Neznámé")
+    return f"{level_str} {'(Aktivní)' if active == 1 else '(Neaktivní)'}"
+
+
+def _decode_status(raw_value: int, divider: int | None) -> str:
+    """Decode unit status."""
+    return STATUS_MAP.get(raw_value, f"Neznámý ({raw_value})")
+
+
+def _porucha_text(raw_value: int) -> str:
+    """Compose sensor fault text (additive values)."""
+    if raw_value == 0:
+        return "Bez poruchy"
+    faults = []
+    if raw_value & 1:
+        faults.append("T1")
+    if raw_value & 2:
+        faults.append("T2")
+    if raw_value & 8:
+        faults.append("Dvířka")
+    return ", ".join(faults) if faults else f"Neznámá ({raw_value})"
+
+
+# All fault bit combinations (bits 1, 2, 8) decoded up front
+PORUCHA_MAP = MappingProxyType(
+    {raw_value: _porucha_text(raw_value) for raw_value in range(16)}
+)
+
+
+def _decode_porucha(raw_value: int, divider: int | None) -> str:
+    """Decode sensor fault."""
+    return PORUCHA_MAP.get(raw_value, f"Neznámá ({raw_value})")
+
+
+def _map_decoder(value_map: Mapping[int, str]):
+    """Build a decoder for a plain text mapping (unknown values pass through)."""
+    get = value_map.get
+
+    def _decode(raw_value: int, divider: int | None) -> int | str:
+        return get(raw_value, raw_value)
+
+    return _decode
+
+
+# Value decoder per register key, chosen once per sensor
+DECODERS = {
+    "TT": _decode_temp,
+    "TT2": _decode_temp,
+    # Combustion time is stored in seconds, divider converts to minutes
+    "CAS": _decode_default,
+    "SER1": _decode_ser1,
+    "SDS": _decode_sds,
+    "STAT": _decode_status,
+    "REZIM": _map_decoder(MODE_MAP),
+    "PALIVO": _map_decoder(FUEL_MAP),
+    "PRILOZ": _map_decoder(REFUEL_MAP),
+    "BARVA": _map_decoder(COLOR_MAP),
+    "BEEP": _map_decoder(BEEP_MAP),
+    "RELE1": _map_decoder(RELAY_MAP),
+    "RELE2": _map_decoder(RELAY_MAP),
+    "PORUCHA": _decode_porucha,
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -152,38 +284,26 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up TimNet sensors."""
-    config = entry.data
-    host = config[CONF_HOST]
-    port = config[CONF_PORT]
-    unit = config.get(CONF_UNIT, 1)
-    scan_interval = config.get(CONF_SCAN_INTERVAL, 8)
-
-    coordinator = TimNetCoordinator(
-        hass,
-        host=host,
-        port=port,
-        unit=unit,
-        scan_interval=scan_interval,
-    )
-
-    entities = []
-    for reg_def in REGISTER_DEFINITIONS:
-        # Skip TimNet 200-only sensors if T2 is inactive (indicates TimNet 100)
-        if reg_def.get("timnet_200_only"):
-            # Check if T2 register shows inactive value (20000, 20001, 20002)
-            t2_value = coordinator.data.get(0x0001, 0)
-            if t2_value in [20000, 20001, 20002]:
-                _LOGGER.info(f"Skipping {reg_def['name']} (TimNet 200 only, device is TimNet 100)")
-                continue
-        
-        entities.append(
-            TimNetSensor(
-                coordinator,
-                entry,
-                reg_def,
-            )
+    # Created and first refreshed in __init__, so data is always present here
+    coordinator: TimNetCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    # Skip TimNet 200-only sensors if T2 is inactive (indicates TimNet 100)
+    defs = _COMMON_DEFS
+    if coordinator.data[0x0001] in T2_INACTIVE_VALUES:
+        for reg_def in _OPT_DEFS:
+            _LOGGER.info(f"Skipping {reg_def['name']} (TimNet 200 only, device is TimNet 100)")
+    else:
+        defs = _COMMON_DEFS + _OPT_DEFS
+
+    entities = [
+        TimNetSensor(
+            coordinator,
+            entry,
+            reg_def,
         )
-    
+        for reg_def in defs
+    ]
+
     # Add door switch binary sensor
     entities.append(
         TimNetDoorSensor(
@@ -203,98 +323,9 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class TimNetCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching TimNet data."""
-        self.host = host
-        self.port = port
-        self.unit = unit
-        self._last_valid_data: dict[int, int] = {}
-        self.connection_ok: bool = True
-        host: str,
-        port: int,
-        unit: int,
-        scan_interval: int,
-    ) -> None:
-        """Initialize the coordinator."""
-        super().__init__(
-            hass,
-            _LOGGER,
-            name=DOMAIN,
-            update_interval=timedelta(seconds=scan_interval),
-        )
-        self.host = host
-        self.port = port
-        self.unit = unit
-        self._last_valid_data: dict[int, int] = {}
-
-    async def _async_update_data(self) -> dict[int, int]:
-        try:
-            data = await self.hass.async_add_executor_job(self._fetch_data)
-            if data:
-                self._last_valid_data = data
-                self.connection_ok = True
-                return data
-            else:
-                self.connection_ok = False
-                _LOGGER.warning(
-                    "No data received from %s:%s - using last known values",
-                    self.host,
-                    self.port,
-                )
-                return self._last_valid_data
-        except Exception as err:
-            self.connection_ok = False
-            _LOGGER.warning(
-                "Error reading from %s:%s: %s - using last known values",
-                self.host,
-                self.port,
-                err,
-            )
-            return self._last_valid_data
-            return self._last_valid_data
-
-    def _fetch_data(self) -> dict[int, int]:
-        """Fetch data from TimNet device (runs in executor)."""
-        client = MinimalModbusTcpClient(self.host, self.port, unit=self.unit)
-        
-        # Read registers 0-21 (covers all defined registers)
-        values = client.read_holding_registers(0x0000, 22)
-        
-        data = {}
-        for i, value in enumerate(values):
-            data[i] = value
-        
-        return data
-
-
 class TimNetSensor(CoordinatorEntity, SensorEntity):
     """Representation of a TimNet sensor."""
 
-    # Status text mappings
-    STATUS_MAP = {
-        0: "Start napájení",
-        1: "Klidový stav 100%",
-        2: "Klidový stav 0%",
-        3: "Zatápění",
-        4: "Start regulace",
-        5: "Hoření (vzrůstající teplota)",
-        6: "Hoření (klesající teplota)",
-        7: "Přiložit",
-        8: "Žárový proces",
-        10: "Nezatopeno",
-        13: "Přetopeno",
-        14: "Dlouho otevřená dvířka",
-        15: "Testovací režim",
-        20: "Porucha teploty",
-    }
-
-    MODE_MAP = {1: "Eco", 2: "Standard", 3: "Turbo"}
-    FUEL_MAP = {1: "Dřevo", 2: "Brikety"}
-    REFUEL_MAP = {1: "-2", 2: "-1", 3: "Standard", 4: "+1", 5: "+2"}
-    COLOR_MAP = {0: "Bez barvy", 1: "Žlutá", 2: "Zelená", 3: "Červená"}
-    BEEP_MAP = {0: "Vypnuto", 15: "Zapnuto"}
-    RELAY_MAP = {0: "Rozepnuto", 1: "Sepnuto"}
-
     def __init__(
         self,
         coordinator: TimNetCoordinator,
@@ -305,6 +336,19 @@ class TimNetSensor(CoordinatorEntity, SensorEntity):
         super().__init__(coordinator)
         self._reg_def = reg_def
         self._address = reg_def["address"]
+        self._decode = DECODERS.get(reg_def["key"], _decode_default)
+        self._divider = reg_def.get("divider")
+        # Raw value at the last state write (gates coordinator updates)
+        self._written_raw: int | None = None
+        # Decode cache for native_value
+        self._last_raw: int | None = None
+        self._last_out: float | int | str | None = None
+        self._static_attrs = {
+            "address": f"0x{self._address:04X}",
+            "register_key": reg_def["key"],
+            "host": coordinator.host,
+            "port": coordinator.port,
+        }
         self._attr_name = f"TimNet {reg_def['name']}"
         self._attr_unique_id = f"{entry.entry_id}_{reg_def['key']}"
         self._attr_has_entity_name = False
@@ -329,108 +373,35 @@ class TimNetSensor(CoordinatorEntity, SensorEntity):
         if "icon" in reg_def:
             self._attr_icon = reg_def["icon"]
 
+    def _raw_value(self) -> int:
+        """Return this sensor's raw register value."""
+        return self.coordinator.data[self._address]
+
     @property
-    def native_value(self) -> float | int | str | None:
+    def native_value(self) -> float | int | str:
         """Return the state of the sensor."""
-        if not self.coordinator.data:
-            return None
-            
-        raw_value = self.coordinator.data.get(self._address)
-        if raw_value is None:
-            return None
-
-        key = self._reg_def["key"]
-        
-        # Handle temperature values (T1, T2)
-        if key in ["TT", "TT2"]:
-            if raw_value == 20000:
-                return "HI"
-            elif raw_value == -20000 or raw_value == 65536 - 20000:  # Handle negative as unsigned
-                return "LO"
-            elif raw_value == 20001:
-                return "---"
-            elif raw_value == 20002:
-                return "Neaktivní"
-            # Temperature is stored as value*10, divide to get °C
-            if "divider" in self._reg_def:
-                return round(raw_value / self._reg_def["divider"], 1)
-            return raw_value
-        
-        # Handle combustion time (stored in seconds, display in minutes)
-        if key == "CAS":
-            if "divider" in self._reg_def:
-                return round(raw_value / self._reg_def["divider"], 1)
-            return raw_value
-        
-        # Handle flap position (0-100%, 255 = initializing)
-        if key == "SER1":
-            if raw_value == 255:
-                return "Inicializace"
-            # Direct percentage value
-            return min(100, max(0, raw_value))
-        
-        # Handle SDS sensitivity
-        if key == "SDS":
-            if raw_value == 255:
-                return "Vypnuto"
-            active = raw_value % 10
-            level = raw_value // 10
-            level_map = {1: "-2", 2: "-1", 3: "Standard", 4: "+1", 5: "+2"}
-            level_str = level_map.get(level, "Neznámé")
-            return f"{level_str} {'(Aktivní)' if active == 1 else '(Neaktivní)'}"
-        
-        # Handle text mappings
-        if key == "STAT":
-            return self.STATUS_MAP.get(raw_value, f"Neznámý ({raw_value})")
-        if key == "REZIM":
-            return self.MODE_MAP.get(raw_value, raw_value)
-        if key == "PALIVO":
-            return self.FUEL_MAP.get(raw_value, raw_value)
-        if key == "PRILOZ":
-            return self.REFUEL_MAP.get(raw_value, raw_value)
-        if key == "BARVA":
-            return self.COLOR_MAP.get(raw_value, raw_value)
-        if key == "BEEP":
-            return self.BEEP_MAP.get(raw_value, raw_value)
-        if key in ["RELE1", "RELE2"]:
-            return self.RELAY_MAP.get(raw_value, raw_value)
-        
-        # Handle sensor fault (additive values)
-        if key == "PORUCHA":
-            if raw_value == 0:
-                return "Bez poruchy"
-            faults = []
-            if raw_value & 1:
-                faults.append("T1")
-            if raw_value & 2:
-                faults.append("T2")
-            if raw_value & 8:
-                faults.append("Dvířka")
-            return ", ".join(faults) if faults else f"Neznámá ({raw_value})"
-        
-        # Default: return raw value (possibly with divider)
-        if "divider" in self._reg_def:
-            return round(raw_value / self._reg_def["divider"], 1)
-        
-        return raw_value
+        raw_value = self._raw_value()
+        if raw_value == self._last_raw:
+            return self._last_out
+
+        self._last_out = self._decode(raw_value, self._divider)
+        self._last_raw = raw_value
+        return self._last_out
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when this sensor's register changed."""
+        raw_value = self._raw_value()
+        if raw_value == self._written_raw:
+            return
+        self._written_raw = raw_value
+        super()._handle_coordinator_update()
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
-        attrs = {
-            "address": f"0x{self._address:04X}",
-            "register_key": self._reg_def["key"],
-            "host": self.coordinator.host,
-            "port": self.coordinator.port,
-        }
-        
         # Add raw value for debugging
-        if self.coordinator.data:
-            raw_value = self.coordinator.data.get(self._address)
-            if raw_value is not None:
-                attrs["raw_value"] = raw_value
-        
-        return attrs
+        return {**self._static_attrs, "raw_value": self._raw_value()}
 
 
 class TimNetDoorSensor(CoordinatorEntity, BinarySensorEntity):
@@ -458,35 +429,22 @@ class TimNetDoorSensor(CoordinatorEntity, BinarySensorEntity):
         )
 
     @property
-    def is_on(self) -> bool | None:
+    def is_on(self) -> bool:
         """Return true if door is open."""
-        if not self.coordinator.data:
-            return None
-            
         # Door switch is at register 0x0004
         # 0 = closed, 255 = open
-        raw_value = self.coordinator.data.get(0x0004)
-        if raw_value is None:
-            return None
-        
-        return raw_value != 0
+        return self.coordinator.data[DOOR_ADDRESS] != 0
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
-        attrs = {
+        return {
             "address": "0x0004",
             "register_key": "INP",
             "host": self.coordinator.host,
             "port": self.coordinator.port,
+            "raw_value": self.coordinator.data[DOOR_ADDRESS],
         }
-        
-        if self.coordinator.data:
-            raw_value = self.coordinator.data.get(0x0004)
-            if raw_value is not None:
-                attrs["raw_value"] = raw_value
-        
-        return attrs
 
 
 class TimNetConnectionSensor(CoordinatorEntity, BinarySensorEntity):